@@ -0,0 +1,20 @@
+// Callbacks del lado del cliente para orbitasimulacion.py (Dash carga /assets automáticamente).
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    orbit: {
+        // Reemplaza la órbita del asteroide anterior por la nueva sin reconstruir la escena base.
+        addAsteroid: function (orbita, figura) {
+            if (!orbita || !figura) {
+                return window.dash_clientside.no_update;
+            }
+            const trazas = figura.data.filter(function (traza) {
+                return traza.meta !== "asteroide";
+            });
+            if (orbita.trace) {
+                trazas.push(Object.assign({}, orbita.trace, { meta: "asteroide" }));
+            }
+            const titulo = Object.assign({}, figura.layout.title, { text: orbita.title });
+            const layout = Object.assign({}, figura.layout, { title: titulo });
+            return Object.assign({}, figura, { data: trazas, layout: layout });
+        }
+    }
+});
@@ -3,3 +3,5 @@ import os
 
 load_dotenv()
 NASA_API_KEY = os.getenv("NASA_API_KEY", "DEMO_KEY")
+REDIS_URL = os.getenv("REDIS_URL")
+ETOPO1_PATH = os.getenv("ETOPO1_PATH")
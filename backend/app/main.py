@@ -1,10 +1,14 @@
-﻿from fastapi import FastAPI
+﻿import asyncio
+
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import NASA_API_KEY
 from app.routers import asteroids, simulate
+from app.services import cache, geodata, http_client, physics_core, population
 
-app = FastAPI(title="DEIMOS API")
+app = FastAPI(title="DEIMOS API", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -17,6 +21,22 @@ app.add_middleware(
 app.include_router(asteroids.router, prefix="/api/asteroids", tags=["asteroids"])
 app.include_router(simulate.router,  prefix="/api/simulate",  tags=["simulate"])
 
+@app.on_event("startup")
+async def startup():
+    physics_core.warm_up()
+    await http_client.startup()
+    app.state.redis = await cache.startup()
+    geodata.load_local_elevation_grid()
+    await geodata.start_elevation_batching()
+    app.state.population_prewarm = asyncio.create_task(population.prewarm_population_cache())
+
+@app.on_event("shutdown")
+async def shutdown():
+    app.state.population_prewarm.cancel()
+    await geodata.stop_elevation_batching()
+    await http_client.shutdown()
+    await cache.shutdown()
+
 @app.get("/api/health")
 def health():
     return {"status": "ok"}
@@ -1,9 +1,14 @@
 ﻿from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, HTTPException
+import numpy as np
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 
+from app.services import cache
 from app.services import physics
 from app.services import sbdb
 
@@ -12,33 +17,62 @@ router = APIRouter(tags=["asteroids"])
 DEFAULT_DENSITY = 3000.0  # kg/m3 fallback when SBDB lacks density
 DEFAULT_ANGLE = 45.0  # degrees
 DEFAULT_VELOCITY = 20.0  # km/s fallback when velocity is missing
+LIST_CACHE_KEY = "asteroids:list:v1"
+LIST_CACHE_TTL = 3600  # seconds
 
 
-def _sort_by_probability(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    return sorted(items, key=lambda item: item.get("impact_probability") or 0.0, reverse=True)
+def _quantize(value: float) -> float:
+    """Round to 6 significant figures so near-identical SBDB values share a cache entry."""
+    return float(f"{value:.6g}")
+
+
+@lru_cache(maxsize=4096)
+def _derive_effects(diameter_m: float, density: float, velocity: float, angle: float) -> Dict[str, Any]:
+    mass_kg = physics.mass_from_diameter_density(diameter_m, density) if diameter_m > 0 else 0.0
+    energy_j = physics.energy_joules(diameter_m, density, velocity) if diameter_m > 0 and velocity > 0 else 0.0
+    energy_mt = energy_j / 4.184e15 if energy_j > 0 else 0.0
+    crater_land, crater_ocean = physics.crater_diameter_km_both(diameter_m, density, velocity, angle)
+
+    return {
+        "mass_kg": mass_kg,
+        "energy_megatons": energy_mt,
+        "kinetic_energy_j": energy_j,
+        "shock_radius_km": physics.shock_radius_km(energy_j),
+        "thermal_radius_km": physics.thermal_radius_km(energy_j),
+        "thermal_flux_at_100km_jm2": physics.thermal_flux_at_distance_jm2(energy_j, 100.0),
+        "crater_diameter_km": crater_land,
+        "crater_diameter_km_ocean": crater_ocean,
+        "tsunami_height_m": physics.tsunami_height_m(energy_j) if energy_j > 0 else None,
+        "seismic_magnitude": physics.seismic_magnitude(energy_j) if energy_j > 0 else None,
+    }
 
 
 @router.get("/", summary="Listado de asteroides (SBDB)")
-def list_asteroids(refresh: bool = False) -> List[Dict[str, Any]]:
+async def list_asteroids(refresh: bool = False) -> Response:
+    if refresh:
+        await cache.delete(LIST_CACHE_KEY)
+    else:
+        blob = await cache.get_bytes(LIST_CACHE_KEY)
+        if blob is not None:
+            return Response(content=blob, media_type="application/json")
+
     try:
-        summaries = sbdb.get_summary(refresh=refresh)
+        table = await run_in_threadpool(sbdb.get_summary_table, refresh=refresh)
     except sbdb.NasaServiceError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
-    ordered = _sort_by_probability(summaries)
+    blob = orjson.dumps(_project_summaries(table))
+    await cache.set_bytes(LIST_CACHE_KEY, LIST_CACHE_TTL, blob)
+    return Response(content=blob, media_type="application/json")
+
+
+def _project_summaries(table: np.ndarray) -> List[Dict[str, Any]]:
+    probability = np.nan_to_num(table["impact_probability"], nan=0.0)
+    ordered = table[np.argsort(-probability, kind="stable")]
+    names = ordered.dtype.names
     return [
-        {
-            "spkid": item["spkid"],
-            "full_name": item["full_name"],
-            "impact_probability": item.get("impact_probability"),
-            "palermo_scale": item.get("palermo_scale"),
-            "torino_scale": item.get("torino_scale"),
-            "diameter_km": item.get("diameter_km"),
-            "density_gcm3": item.get("density_gcm3"),
-            "absolute_magnitude_h": item.get("absolute_magnitude_h"),
-            "pha": item.get("pha"),
-        }
-        for item in ordered
+        {name: None if value != value else value for name, value in zip(names, row)}
+        for row in ordered.tolist()
     ]
 
 
@@ -58,17 +92,7 @@ def get_asteroid(spkid: str, refresh: bool = False) -> Dict[str, Any]:
         velocity = DEFAULT_VELOCITY
     angle = float(detail.get("angle_deg") or DEFAULT_ANGLE)
 
-    mass_kg = physics.mass_from_diameter_density(diameter_m, density) if diameter_m > 0 else 0.0
-    energy_j = physics.energy_joules(diameter_m, density, velocity) if diameter_m > 0 and velocity > 0 else 0.0
-    energy_mt = energy_j / 4.184e15 if energy_j > 0 else 0.0
-
-    crater_land = physics.crater_diameter_km(diameter_m, density, velocity, angle, ocean=False)
-    crater_ocean = physics.crater_diameter_km(diameter_m, density, velocity, angle, ocean=True)
-    shock_radius = physics.shock_radius_km(energy_j)
-    thermal_radius = physics.thermal_radius_km(energy_j)
-    thermal_flux_100 = physics.thermal_flux_at_distance_jm2(energy_j, 100.0)
-    seismic = physics.seismic_magnitude(energy_j) if energy_j > 0 else None
-    tsunami = physics.tsunami_height_m(energy_j) if energy_j > 0 else None
+    effects = _derive_effects(_quantize(diameter_m), _quantize(density), _quantize(velocity), _quantize(angle))
 
     response: Dict[str, Any] = {
         "spkid": detail["spkid"],
@@ -83,16 +107,7 @@ def get_asteroid(spkid: str, refresh: bool = False) -> Dict[str, Any]:
         "impact_probability": detail.get("impact_probability"),
         "palermo_scale": detail.get("palermo_scale"),
         "torino_scale": detail.get("torino_scale"),
-        "mass_kg": mass_kg,
-        "energy_megatons": energy_mt,
-        "kinetic_energy_j": energy_j,
-        "shock_radius_km": shock_radius,
-        "thermal_radius_km": thermal_radius,
-        "thermal_flux_at_100km_jm2": thermal_flux_100,
-        "crater_diameter_km": crater_land,
-        "crater_diameter_km_ocean": crater_ocean,
-        "tsunami_height_m": tsunami,
-        "seismic_magnitude": seismic,
+        **effects,
         "reported_energy_megatons": detail.get("reported_energy_megatons"),
         "reported_mass_kg": detail.get("reported_mass_kg"),
         "vi_data": detail.get("vi_data"),
@@ -1,4 +1,5 @@
 ﻿import math
+from typing import Any, Dict
 
 from fastapi import APIRouter
 
@@ -43,11 +44,53 @@ def _build_environment_model(
     )
 
 
+def _compute_effects(
+    diameter_m: float,
+    density_kgm3: float,
+    velocity_kms: float,
+    angle_deg: float,
+    surface_density: float,
+    gravity_ms2: float,
+    slope_deg: float,
+    is_water_surface: bool,
+    water_depth_m: float | None,
+) -> Dict[str, Any]:
+    """CPU-bound physics for one impact."""
+    mass_kg = physics.mass_from_diameter_density(diameter_m, density_kgm3)
+    energy_j = physics.energy_joules(diameter_m, density_kgm3, velocity_kms)
+    crater_km = physics.crater_diameter_km(
+        diameter_m,
+        density_kgm3,
+        velocity_kms,
+        angle_deg,
+        ocean=is_water_surface,
+        rho_t=surface_density,
+        gravity_ms2=gravity_ms2,
+        slope_deg=slope_deg,
+    )
+    density_ratio = surface_density / physics.TARGET_DENSITY if surface_density else 1.0
+    shock_km = physics.shock_radius_km(energy_j, density_factor=density_ratio)
+    thermal_radius_km = physics.thermal_radius_km(energy_j)
+    dominant_radius = max(shock_km, thermal_radius_km)
+    return {
+        "mass_kg": mass_kg,
+        "energy_j": energy_j,
+        "energy_mt": energy_j / 4.184e15,
+        "crater_km": crater_km,
+        "shock_km": shock_km,
+        "thermal_radius_km": thermal_radius_km,
+        "thermal_flux_100km": physics.thermal_flux_at_distance_jm2(energy_j, 100.0),
+        "tsunami": physics.tsunami_height_m(energy_j, water_depth_m=water_depth_m) if is_water_surface else None,
+        "seismic": physics.seismic_magnitude(energy_j),
+        "area_km2": math.pi * dominant_radius ** 2,
+    }
+
+
 @router.post("")
 async def simulate(req: SimulationRequest) -> SimulationResponse:
     profile: SiteProfile | None = None
     try:
-        profile = geodata.get_site_profile(req.site.lat, req.site.lon)
+        profile = await geodata.get_site_profile(req.site.lat, req.site.lon)
     except GeoDataError:
         profile = None
 
@@ -73,29 +116,28 @@ async def simulate(req: SimulationRequest) -> SimulationResponse:
         country_code = profile.country_code
 
     asteroid = req.asteroid
-    mass_kg = physics.mass_from_diameter_density(asteroid.diameter_m, asteroid.density_kgm3)
-    energy_j = physics.energy_joules(asteroid.diameter_m, asteroid.density_kgm3, asteroid.velocity_kms)
-    energy_mt = energy_j / 4.184e15
-
     is_water_surface = req.ocean or (terrain_type == "water")
-    crater_km = physics.crater_diameter_km(
+    # Microseconds of numba work: far cheaper inline than a round trip to a process pool.
+    computed = _compute_effects(
         asteroid.diameter_m,
         asteroid.density_kgm3,
         asteroid.velocity_kms,
         asteroid.angle_deg,
-        ocean=is_water_surface,
-        rho_t=surface_density,
-        gravity_ms2=gravity_ms2,
-        slope_deg=slope_deg,
+        surface_density,
+        gravity_ms2,
+        slope_deg,
+        is_water_surface,
+        water_depth_m,
     )
-    density_ratio = surface_density / physics.TARGET_DENSITY if surface_density else 1.0
-    shock_km = physics.shock_radius_km(energy_j, density_factor=density_ratio)
-    thermal_radius_km = physics.thermal_radius_km(energy_j)
-    thermal_flux_100km = physics.thermal_flux_at_distance_jm2(energy_j, 100.0)
-    tsunami = physics.tsunami_height_m(energy_j, water_depth_m=water_depth_m) if is_water_surface else None
-
-    dominant_radius = max(shock_km, thermal_radius_km)
-    area_km2 = math.pi * dominant_radius ** 2
+    mass_kg = computed["mass_kg"]
+    energy_j = computed["energy_j"]
+    energy_mt = computed["energy_mt"]
+    crater_km = computed["crater_km"]
+    shock_km = computed["shock_km"]
+    thermal_radius_km = computed["thermal_radius_km"]
+    thermal_flux_100km = computed["thermal_flux_100km"]
+    tsunami = computed["tsunami"]
+    area_km2 = computed["area_km2"]
 
     population_density = 0.0
     density_source = None
@@ -110,7 +152,7 @@ async def simulate(req: SimulationRequest) -> SimulationResponse:
         api_density: float | None = None
         if country_code:
             try:
-                api_density = population.get_population_density(country_code)
+                api_density = await population.get_population_density(country_code)
                 used_population_api = True
                 density_source = "World Bank EN.POP.DNST"
             except PopulationDensityError:
@@ -128,7 +170,7 @@ async def simulate(req: SimulationRequest) -> SimulationResponse:
     est_people = int(min(max(density_estimate_people, 0.0), population_cap, GLOBAL_POPULATION_ESTIMATE))
 
     gsurv = physics.global_survival_probability(asteroid.diameter_m, est_people, GLOBAL_POPULATION_ESTIMATE)
-    seismic = physics.seismic_magnitude(energy_j)
+    seismic = computed["seismic"]
 
     notes = [
         "Modelos basados en ecuaciones de Purdue Impact: crater_c y escalas de energia.",
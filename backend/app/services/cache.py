@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.config import REDIS_URL
+
+# Short timeouts so an unreachable Redis falls back to live requests instead of stalling them.
+REDIS_SOCKET_TIMEOUT = 0.2
+REDIS_CONNECT_TIMEOUT = 0.5
+
+_redis: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """Return the shared Redis connection, or None when caching is disabled."""
+    return _redis
+
+
+async def startup() -> Optional[aioredis.Redis]:
+    global _redis
+    if REDIS_URL and _redis is None:
+        _redis = aioredis.from_url(
+            REDIS_URL,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+        )
+    return _redis
+
+
+async def shutdown() -> None:
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+    _redis = None
+
+
+async def get_json(key: str) -> Any:
+    if _redis is None:
+        return None
+    try:
+        value = await _redis.get(key)
+    except RedisError:
+        return None
+    if value is None:
+        return None
+    return json.loads(value)
+
+
+async def set_json(key: str, ttl_seconds: int, payload: Any) -> None:
+    if _redis is None:
+        return
+    try:
+        await _redis.setex(key, ttl_seconds, json.dumps(payload))
+    except RedisError:
+        pass
+
+
+async def get_bytes(key: str) -> Optional[bytes]:
+    if _redis is None:
+        return None
+    try:
+        return await _redis.get(key)
+    except RedisError:
+        return None
+
+
+async def set_bytes(key: str, ttl_seconds: int, payload: bytes) -> None:
+    if _redis is None:
+        return
+    try:
+        await _redis.setex(key, ttl_seconds, payload)
+    except RedisError:
+        pass
+
+
+async def delete(key: str) -> None:
+    if _redis is None:
+        return
+    try:
+        await _redis.delete(key)
+    except RedisError:
+        pass
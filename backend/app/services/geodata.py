@@ -1,14 +1,38 @@
 ﻿from __future__ import annotations
 
+import asyncio
 import math
 from dataclasses import dataclass
+from pathlib import Path
 from typing import List, Optional
 
 import httpx
+import numpy as np
+
+from app.config import ETOPO1_PATH
+from app.services import cache
+from app.services.http_client import get_client
 
 OPENTOPODATA_URL = "https://api.opentopodata.org/v1/etopo1"
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/reverse"
 USER_AGENT = "DEIMOSImpactSim/0.1 (+https://spaceappschallenge.org/)"
+ELEVATION_CACHE_TTL = 30 * 24 * 3600  # 30 days, etopo1 is static
+LANDFORM_CACHE_TTL = 7 * 24 * 3600  # 7 days
+STENCIL = ("center", "north", "south", "east", "west")
+OPENTOPODATA_MAX_LOCATIONS = 100
+BATCH_WINDOW_S = 0.010
+# NOAA ETOPO1 bedrock, grid-registered int16 binary (etopo1_bed_g_i2.bin):
+# 1 arc-minute cells, row 0 at 90N and column 0 at 180W.
+ETOPO1_GRID_PATH = (
+    Path(ETOPO1_PATH)
+    if ETOPO1_PATH
+    else Path(__file__).resolve().parents[1] / "data" / "etopo1" / "etopo1_bed_g_i2.bin"
+)
+ETOPO1_ROWS = 10_801
+ETOPO1_COLS = 21_601
+ETOPO1_CELLS_PER_DEGREE = 60
+
+_etopo1_grid: Optional[np.memmap] = None
 
 class GeoDataError(RuntimeError):
     """Raised when terrain metadata cannot be retrieved."""
@@ -33,46 +57,208 @@ def _meters_per_degree(lat: float) -> tuple[float, float]:
     return meters_per_deg_lat, meters_per_deg_lon
 
 
-def _fetch_elevations(lat: float, lon: float, delta: float) -> dict[str, float]:
-    samples = [
-        ("center", lat, lon),
-        ("north", lat + delta, lon),
-        ("south", lat - delta, lon),
-        ("east", lat, lon + delta),
-        ("west", lat, lon - delta),
+def load_local_elevation_grid() -> bool:
+    """Memory-map the local ETOPO1 grid if it is installed; return whether it is available."""
+    global _etopo1_grid
+    if _etopo1_grid is not None:
+        return True
+    expected_size = ETOPO1_ROWS * ETOPO1_COLS * np.dtype("<i2").itemsize
+    try:
+        if ETOPO1_GRID_PATH.stat().st_size != expected_size:
+            return False
+    except OSError:
+        return False
+    _etopo1_grid = np.memmap(ETOPO1_GRID_PATH, dtype="<i2", mode="r", shape=(ETOPO1_ROWS, ETOPO1_COLS))
+    return True
+
+
+def _local_elevations(lat: float, lon: float, delta: float) -> Optional[np.ndarray]:
+    """Bilinearly sample the stencil from the local ETOPO1 grid, like OpenTopoData does."""
+    grid = _etopo1_grid
+    if grid is None:
+        return None
+    samples = np.asarray(_stencil_samples(lat, lon, delta), dtype=np.float64)
+    rows = np.clip((90.0 - samples[:, 0]) * ETOPO1_CELLS_PER_DEGREE, 0.0, ETOPO1_ROWS - 1.0)
+    # The last column repeats 180E, so wrap on the unique 21600 columns.
+    cols = np.mod((samples[:, 1] + 180.0) * ETOPO1_CELLS_PER_DEGREE, ETOPO1_COLS - 1.0)
+    iy = np.minimum(rows.astype(np.intp), ETOPO1_ROWS - 2)
+    ix = np.minimum(cols.astype(np.intp), ETOPO1_COLS - 2)
+    fy = rows - iy
+    fx = cols - ix
+    top = grid[iy, ix] * (1.0 - fx) + grid[iy, ix + 1] * fx
+    bottom = grid[iy + 1, ix] * (1.0 - fx) + grid[iy + 1, ix + 1] * fx
+    return top * (1.0 - fy) + bottom * fy
+
+
+async def _fetch_elevations(lat: float, lon: float, delta: float) -> np.ndarray:
+    """Return the elevation stencil as a float64 array ordered like STENCIL."""
+    local = _local_elevations(lat, lon, delta)
+    if local is not None:
+        return local
+    key = f"etopo1:{round(lat, 2)}:{round(lon, 2)}:{delta}"
+    cached = await cache.get_json(key)
+    if cached is not None:
+        return np.asarray(cached, dtype=np.float64)
+    elevations = await _request_elevations(lat, lon, delta)
+    await cache.set_json(key, ELEVATION_CACHE_TTL, elevations)
+    return np.asarray(elevations, dtype=np.float64)
+
+
+async def _request_elevations(lat: float, lon: float, delta: float) -> list[float]:
+    if _batcher.running:
+        return await _batcher.submit(lat, lon, delta)
+    (elevations,) = await _request_elevation_batch([(lat, lon, delta)])
+    return elevations
+
+
+def _stencil_samples(lat: float, lon: float, delta: float) -> list[tuple[float, float]]:
+    # Keep every sample on the globe; OpenTopoData rejects the whole query for |lat| > 90.
+    north = min(lat + delta, 90.0)
+    south = max(lat - delta, -90.0)
+    return [
+        (lat, lon),
+        (north, lon),
+        (south, lon),
+        (lat, _wrap_longitude(lon + delta)),
+        (lat, _wrap_longitude(lon - delta)),
     ]
-    locations = "|".join(f"{lat_val:.6f},{lon_val:.6f}" for _, lat_val, lon_val in samples)
-    with httpx.Client(timeout=10.0) as client:
-        response = client.get(OPENTOPODATA_URL, params={"locations": locations})
-        response.raise_for_status()
-        payload = response.json()
+
+
+def _wrap_longitude(lon: float) -> float:
+    return (lon + 180.0) % 360.0 - 180.0
+
+
+async def _request_elevation_batch(sites: list[tuple[float, float, float]]) -> list[list[float]]:
+    """Query the stencils of several sites in a single OpenTopoData call."""
+    samples = [sample for site in sites for sample in _stencil_samples(*site)]
+    locations = "|".join(f"{lat_val:.6f},{lon_val:.6f}" for lat_val, lon_val in samples)
+    response = await get_client().get(OPENTOPODATA_URL, params={"locations": locations})
+    response.raise_for_status()
+    payload = response.json()
     if payload.get("status") != "OK":
         raise GeoDataError(f"OpenTopoData returned status {payload.get('status')!r}")
     results = payload.get("results") or []
     if len(results) != len(samples):
         raise GeoDataError("Incomplete elevation samples returned by OpenTopoData")
-    return {
-        key: float(entry.get("elevation", 0.0))
-        for (key, _, _), entry in zip(samples, results)
-    }
+    values = [float(entry.get("elevation", 0.0)) for entry in results]
+    size = len(STENCIL)
+    return [values[index:index + size] for index in range(0, len(values), size)]
+
+
+def _is_bad_input(exc: Exception) -> bool:
+    """Whether a failed batch was rejected for its content rather than by rate limits or outages."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 400
+    return isinstance(exc, GeoDataError)
+
+
+class _ElevationBatcher:
+    """Coalesces concurrent stencil lookups into shared OpenTopoData requests."""
+
+    max_sites = OPENTOPODATA_MAX_LOCATIONS // len(STENCIL)
+
+    def __init__(self) -> None:
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._dispatching: set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
 
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
 
-def _compute_slope_and_roughness(elevs: dict[str, float], lat: float, delta: float) -> tuple[float, float]:
-    center = elevs["center"]
-    neighbors = [elevs["north"], elevs["south"], elevs["east"], elevs["west"]]
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._queue = None
+
+    async def submit(self, lat: float, lon: float, delta: float) -> list[float]:
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((lat, lon, delta), future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + BATCH_WINDOW_S
+            while len(batch) < self.max_sites:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            task = loop.create_task(self._dispatch(batch))
+            self._dispatching.add(task)
+            task.add_done_callback(self._dispatching.discard)
+
+    @classmethod
+    async def _dispatch(cls, batch: list[tuple[tuple[float, float, float], asyncio.Future]]) -> None:
+        try:
+            results = await _request_elevation_batch([site for site, _ in batch])
+        except Exception as exc:
+            if len(batch) > 1 and _is_bad_input(exc):
+                # Retry site by site so one bad input cannot fail the other coalesced requests.
+                await asyncio.gather(*(cls._dispatch([item]) for item in batch))
+                return
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), elevations in zip(batch, results):
+            if not future.done():
+                future.set_result(elevations)
+
+
+_batcher = _ElevationBatcher()
+
+
+async def start_elevation_batching() -> None:
+    await _batcher.start()
+
+
+async def stop_elevation_batching() -> None:
+    await _batcher.stop()
+
+
+def _compute_slope_and_roughness(elevs: np.ndarray, lat: float, delta: float) -> tuple[float, float]:
     meters_per_deg_lat, meters_per_deg_lon = _meters_per_degree(lat)
-    dz_dy = (elevs["north"] - elevs["south"]) / (2.0 * meters_per_deg_lat * delta)
-    dz_dx = (elevs["east"] - elevs["west"]) / (2.0 * meters_per_deg_lon * delta)
-    gradient = math.sqrt(dz_dx ** 2 + dz_dy ** 2)
-    slope_rad = math.atan(gradient)
-    slope_deg = math.degrees(slope_rad)
-    mean_neighbor = sum(neighbors) / len(neighbors)
-    roughness = math.sqrt(sum((value - mean_neighbor) ** 2 for value in neighbors) / len(neighbors))
-    roughness = abs(roughness)
+    # Near the poles the stencil is clamped, so use the actual north-south span.
+    lat_span = 2.0 * delta if abs(lat) + delta <= 90.0 else min(lat + delta, 90.0) - max(lat - delta, -90.0)
+    dz_dy = (elevs[1] - elevs[2]) / (meters_per_deg_lat * lat_span)
+    dz_dx = (elevs[3] - elevs[4]) / (2.0 * meters_per_deg_lon * delta)
+    slope_deg = math.degrees(math.atan2(math.hypot(dz_dx, dz_dy), 1.0))
+    roughness = float(np.std(elevs[1:]))
     return slope_deg, roughness
 
 
-def _fetch_landform(lat: float, lon: float) -> tuple[Optional[str], Optional[str]]:
+async def _fetch_landform(lat: float, lon: float) -> tuple[Optional[str], Optional[str]]:
+    key = f"nominatim:{round(lat, 2)}:{round(lon, 2)}"
+    cached = await cache.get_json(key)
+    if cached is not None:
+        return cached[0], cached[1]
+    try:
+        landform, country_code = await _request_landform(lat, lon)
+    except httpx.HTTPError:
+        return None, None
+    await cache.set_json(key, LANDFORM_CACHE_TTL, [landform, country_code])
+    return landform, country_code
+
+
+async def _request_landform(lat: float, lon: float) -> tuple[Optional[str], Optional[str]]:
     params = {
         "format": "jsonv2",
         "lat": f"{lat:.6f}",
@@ -82,13 +268,9 @@ def _fetch_landform(lat: float, lon: float) -> tuple[Optional[str], Optional[str
         "addressdetails": "1",
     }
     headers = {"User-Agent": USER_AGENT}
-    try:
-        with httpx.Client(timeout=10.0, headers=headers) as client:
-            response = client.get(NOMINATIM_URL, params=params)
-            response.raise_for_status()
-            payload = response.json()
-    except httpx.HTTPError:
-        return None, None
+    response = await get_client().get(NOMINATIM_URL, params=params, headers=headers)
+    response.raise_for_status()
+    payload = response.json()
     landform: Optional[str] = None
     category = payload.get("category")
     kind = payload.get("type")
@@ -108,17 +290,25 @@ def _fetch_landform(lat: float, lon: float) -> tuple[Optional[str], Optional[str
 
 
 
-def get_site_profile(lat: float, lon: float, delta: float = 0.01) -> SiteProfile:
-    try:
-        elevations = _fetch_elevations(lat, lon, delta)
-    except httpx.HTTPError as exc:
-        raise GeoDataError(f"Failed to query OpenTopoData: {exc}") from exc
+async def get_site_profile(lat: float, lon: float, delta: float = 0.01) -> SiteProfile:
+    elevations, landform_result = await asyncio.gather(
+        _fetch_elevations(lat, lon, delta),
+        _fetch_landform(lat, lon),
+        return_exceptions=True,
+    )
+    if isinstance(elevations, httpx.HTTPError):
+        raise GeoDataError(f"Failed to query OpenTopoData: {elevations}") from elevations
+    if isinstance(elevations, BaseException):
+        raise elevations
+    if isinstance(landform_result, BaseException):
+        landform, country_code = None, None
+    else:
+        landform, country_code = landform_result
     slope_deg, roughness_m = _compute_slope_and_roughness(elevations, lat, delta)
-    elevation = elevations["center"]
+    elevation = float(elevations[0])
     terrain_type = "water" if elevation < 0 else "land"
     water_depth = abs(elevation) if terrain_type == "water" else None
-    landform, country_code = _fetch_landform(lat, lon)
-    sources = ["OpenTopoData etopo1"]
+    sources = ["NOAA ETOPO1 (local grid)" if _etopo1_grid is not None else "OpenTopoData etopo1"]
     if landform or country_code:
         sources.append("OpenStreetMap Nominatim")
     return SiteProfile(
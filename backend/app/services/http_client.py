@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import httpx
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(http2=True, timeout=DEFAULT_TIMEOUT, limits=DEFAULT_LIMITS)
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared pooled client, creating it lazily outside the app lifecycle."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+async def startup() -> httpx.AsyncClient:
+    return get_client()
+
+
+async def shutdown() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+    _client = None
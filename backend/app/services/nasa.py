@@ -1,15 +1,19 @@
+from typing import Optional
+
 import httpx
+
 from app.config import NASA_API_KEY
+from app.services.http_client import get_client
 
 BASE_NEOWS = "https://api.nasa.gov/neo/rest/v1"
 SBDB = "https://ssd-api.jpl.nasa.gov/sbdb.api"
 
-async def search_asteroids_by_name(q: str):
-    async with httpx.AsyncClient(timeout=20) as client:
-        resp = await client.get(SBDB, params={"des": q})
-        if resp.status_code != 200:
-            return None
-        return resp.json()
+async def search_asteroids_by_name(q: str, client: Optional[httpx.AsyncClient] = None):
+    client = client or get_client()
+    resp = await client.get(SBDB, params={"des": q}, timeout=20)
+    if resp.status_code != 200:
+        return None
+    return resp.json()
 
 async def popular_asteroids_seed():
     return [
@@ -1,13 +1,46 @@
 import math
+import re
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Optional
 
+from app.services import physics_core
+from app.services.physics_core import THERMAL_EFFICIENCY, THERMAL_FLUX_THRESHOLD
+
 EARTH_GRAVITY = 9.80665  # m/s^2
 EARTH_RADIUS_M = 6_371_000.0
 TARGET_DENSITY = 2700     # kg/m3, average continental crust
 WATER_DENSITY = 1025      # kg/m3, mean seawater density
 ICE_DENSITY = 917         # kg/m3
-THERMAL_EFFICIENCY = 3e-3
-THERMAL_FLUX_THRESHOLD = 15e3  # J/m^2
+G_TERM_DEFAULT = EARTH_GRAVITY ** -0.22
+CRATER_CONST_LAND = 1.161
+CRATER_CONST_OCEAN = 1.365
+# Baseline survival per diameter band: <1 km, <5 km, <10 km, >=10 km.
+_SURVIVAL_THRESHOLDS_M = (1000.0, 5000.0, 10000.0)
+_SURVIVAL_BASES = (0.9999, 0.99, 0.95, 0.80)
+
+# Landform keywords in priority order: the first listed keyword found wins.
+_DENSITY_KEYWORDS = {
+    "ice": ICE_DENSITY,
+    "glacier": ICE_DENSITY,
+    "urban": 2400.0,
+    "city": 2400.0,
+    "desert": 2000.0,
+    "sand": 2000.0,
+    "forest": 2200.0,
+}
+_DENSITY_RE = re.compile("|".join(_DENSITY_KEYWORDS))
+_POPULATION_KEYWORDS = {
+    "city": 1200.0,
+    "town": 1200.0,
+    "suburb": 1200.0,
+    "residential": 1200.0,
+    "village": 200.0,
+    "hamlet": 200.0,
+    "airport": 150.0,
+    "industrial": 150.0,
+}
+_POPULATION_RE = re.compile("|".join(_POPULATION_KEYWORDS))
 
 
 def mass_from_diameter_density(d_m: float, rho: float) -> float:
@@ -19,12 +52,11 @@ def mass_from_diameter_density(d_m: float, rho: float) -> float:
 
 def energy_joules(d_m: float, rho: float, v_kms: float) -> float:
     """Kinetic energy following E = (pi/12) * rho * L^3 * v^2."""
-    velocity_ms = v_kms * 1_000.0
-    return (math.pi / 12.0) * rho * (d_m ** 3) * (velocity_ms ** 2)
+    return physics_core.energy_joules(d_m, rho, v_kms)
 
 
 def energy_megatons(d_m: float, rho: float, v_kms: float) -> float:
-    return energy_joules(d_m, rho, v_kms) / 4.184e15
+    return energy_joules(d_m, rho, v_kms) * physics_core.INV_MEGATON_J
 
 
 def gravity_at_elevation(elevation_m: float) -> float:
@@ -34,21 +66,37 @@ def gravity_at_elevation(elevation_m: float) -> float:
 
 
 def target_density_for_surface(terrain_type: Optional[str], elevation_m: float, landform: Optional[str]) -> float:
+    if elevation_m > 2500:
+        elevation_band = 1
+    elif elevation_m < -100:
+        elevation_band = -1
+    else:
+        elevation_band = 0
+    return _target_density(terrain_type, elevation_band, landform.lower() if landform else None)
+
+
+def _keyword_value(pattern: re.Pattern, keywords: dict, lf: str) -> Optional[float]:
+    found = pattern.findall(lf)
+    if not found:
+        return None
+    if len(found) > 1:
+        # Several keywords matched: honour the table's precedence, not string position.
+        ranks = list(keywords)
+        found.sort(key=ranks.index)
+    return keywords[found[0]]
+
+
+@lru_cache(maxsize=1024)
+def _target_density(terrain_type: Optional[str], elevation_band: int, lf: Optional[str]) -> float:
     if terrain_type == "water":
         return WATER_DENSITY
-    if landform:
-        lf = landform.lower()
-        if "ice" in lf or "glacier" in lf:
-            return ICE_DENSITY
-        if "urban" in lf or "city" in lf:
-            return 2400.0
-        if "desert" in lf or "sand" in lf:
-            return 2000.0
-        if "forest" in lf:
-            return 2200.0
-    if elevation_m > 2500:
+    if lf:
+        density = _keyword_value(_DENSITY_RE, _DENSITY_KEYWORDS, lf)
+        if density is not None:
+            return density
+    if elevation_band > 0:
         return 2600.0
-    if elevation_m < -100:
+    if elevation_band < 0:
         return WATER_DENSITY
     return TARGET_DENSITY
 
@@ -56,64 +104,48 @@ def target_density_for_surface(terrain_type: Optional[str], elevation_m: float,
 def crater_diameter_km(d_m: float, rho_i: float, v_kms: float, angle_deg: float, ocean: bool = False,
                         rho_t: float = TARGET_DENSITY, gravity_ms2: float = EARTH_GRAVITY,
                         slope_deg: float = 0.0) -> float:
+    const = CRATER_CONST_OCEAN if ocean else CRATER_CONST_LAND
+    return const * _crater_scaling_km(d_m, rho_i, v_kms, angle_deg, rho_t, gravity_ms2, slope_deg)
+
+
+def crater_diameter_km_both(d_m: float, rho_i: float, v_kms: float, angle_deg: float,
+                            rho_t: float = TARGET_DENSITY, gravity_ms2: float = EARTH_GRAVITY,
+                            slope_deg: float = 0.0) -> tuple[float, float]:
+    """Land and ocean crater diameters, evaluating the shared scaling terms once."""
+    scaling = _crater_scaling_km(d_m, rho_i, v_kms, angle_deg, rho_t, gravity_ms2, slope_deg)
+    return CRATER_CONST_LAND * scaling, CRATER_CONST_OCEAN * scaling
+
+
+def _crater_scaling_km(d_m: float, rho_i: float, v_kms: float, angle_deg: float,
+                       rho_t: float, gravity_ms2: float, slope_deg: float) -> float:
     if d_m <= 0 or v_kms <= 0 or angle_deg <= 0:
         return 0.0
-    const = 1.365 if ocean else 1.161
-    velocity_ms = v_kms * 1_000.0
-    density_term = (rho_i / rho_t) ** (1.0 / 3.0)
-    diameter_term = d_m ** 0.78
-    velocity_term = velocity_ms ** 0.44
-    gravity_term = gravity_ms2 ** -0.22
+    gravity_term = G_TERM_DEFAULT if gravity_ms2 == EARTH_GRAVITY else math.pow(gravity_ms2, -0.22)
     angle_term = math.sin(math.radians(angle_deg)) ** (1.0 / 3.0)
-    slope_factor = math.cos(math.radians(min(abs(slope_deg), 75.0)))
-    slope_factor = max(slope_factor, 0.5)
-    crater_m = const * density_term * diameter_term * velocity_term * gravity_term * angle_term * slope_factor
-    return crater_m / 1_000.0
+    slope_factor = max(math.cos(math.radians(min(abs(slope_deg), 75.0))), 0.5)
+    return physics_core.crater_scaling_km(rho_i, rho_t, d_m, v_kms, gravity_term, angle_term, slope_factor)
 
 
 def thermal_radius_km(E_joules: float) -> float:
-    if E_joules <= 0:
-        return 0.0
-    radius_m = math.sqrt((THERMAL_EFFICIENCY * E_joules) / (2.0 * math.pi * THERMAL_FLUX_THRESHOLD))
-    return radius_m / 1_000.0
+    return physics_core.thermal_radius_km(E_joules)
 
 
 def thermal_flux_at_distance_jm2(E_joules: float, distance_km: float) -> float:
-    if E_joules <= 0 or distance_km <= 0:
-        return 0.0
-    distance_m = distance_km * 1_000.0
-    return (THERMAL_EFFICIENCY * E_joules) / (2.0 * math.pi * distance_m ** 2)
+    return physics_core.thermal_flux_at_distance_jm2(E_joules, distance_km)
 
 
 def shock_radius_km(E_joules: float, density_factor: float = 1.0) -> float:
-    if E_joules <= 0:
-        return 0.0
-    density_factor = max(density_factor, 0.5)
-    return 1.8 * (E_joules / 4.184e15) ** (1.0 / 3.0) * density_factor ** -0.1
+    return physics_core.shock_radius_km(E_joules, density_factor)
 
 
 def tsunami_height_m(E_joules: float, distance_km: float = 50.0, water_depth_m: Optional[float] = None) -> float:
-    if E_joules <= 0:
-        return 0.0
-    E_mt = E_joules / 4.184e15
-    if E_mt < 1:
-        return 0.5
-    depth_factor = 1.0
-    if water_depth_m is not None:
-        depth_factor = min(1.0, max(0.35, water_depth_m / 4_000.0))
-    return min(80.0, 0.12 * (E_mt ** 0.5) * depth_factor * (50.0 / max(distance_km, 1.0)) ** 0.5)
+    depth = physics_core.NO_WATER_DEPTH if water_depth_m is None else max(water_depth_m, 0.0)
+    return physics_core.tsunami_height_m(E_joules, distance_km, depth)
 
 
 
 def global_survival_probability(d_m: float, affected_people: float = 0.0, total_population: float = 0.0) -> float:
-    if d_m < 1000:
-        base = 0.9999
-    elif d_m < 5000:
-        base = 0.99
-    elif d_m < 10000:
-        base = 0.95
-    else:
-        base = 0.80
+    base = _SURVIVAL_BASES[bisect_right(_SURVIVAL_THRESHOLDS_M, d_m)]
 
     if total_population > 0 and affected_people > 0:
         fraction = min(max(affected_people / total_population, 0.0), 1.0)
@@ -125,22 +157,21 @@ def global_survival_probability(d_m: float, affected_people: float = 0.0, total_
 
 
 def seismic_magnitude(E_joules: float) -> float:
-    if E_joules <= 0:
-        return 0.0
-    return 0.67 * math.log10(E_joules) - 5.87
+    return physics_core.seismic_magnitude(E_joules)
 
 
 def population_density_for_surface(terrain_type: Optional[str], slope_deg: float, landform: Optional[str]) -> float:
+    return _population_density(terrain_type, slope_deg > 20.0, landform.lower() if landform else None)
+
+
+@lru_cache(maxsize=1024)
+def _population_density(terrain_type: Optional[str], steep: bool, lf: Optional[str]) -> float:
     if terrain_type == "water":
         return 0.0
-    if landform:
-        lf = landform.lower()
-        if any(token in lf for token in ("city", "town", "suburb", "residential")):
-            return 1200.0
-        if "village" in lf or "hamlet" in lf:
-            return 200.0
-        if "airport" in lf or "industrial" in lf:
-            return 150.0
-    if slope_deg > 20.0:
+    if lf:
+        density = _keyword_value(_POPULATION_RE, _POPULATION_KEYWORDS, lf)
+        if density is not None:
+            return density
+    if steep:
         return 15.0
     return 80.0
@@ -0,0 +1,96 @@
+"""Numba-compiled numeric kernels behind the public helpers in ``physics``.
+
+Kernels are compiled eagerly for float64 only, so int arguments are converted
+on entry instead of compiling (and overflowing in) int64 specializations.
+``physics`` keeps the Python-facing signatures (defaults, ``Optional``
+arguments, trig factors) and delegates here.
+"""
+import math
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - pure-Python fallback when numba is unavailable
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+THERMAL_EFFICIENCY = 3e-3
+THERMAL_FLUX_THRESHOLD = 15e3  # J/m^2
+MEGATON_J = 4.184e15
+INV_MEGATON_J = 1.0 / MEGATON_J
+_THERMAL_OVER_TWO_PI = THERMAL_EFFICIENCY / (2.0 * math.pi)
+_THERMAL_OVER_TWO_PI_FLUX = _THERMAL_OVER_TWO_PI / THERMAL_FLUX_THRESHOLD
+NO_WATER_DEPTH = -1.0  # sentinel for "depth unknown"; kernels cannot take None
+
+
+@njit("float64(float64, float64, float64)", cache=True, fastmath=True)
+def energy_joules(d_m, rho, v_kms):
+    velocity_ms = v_kms * 1_000.0
+    return (math.pi / 12.0) * rho * (d_m ** 3) * (velocity_ms ** 2)
+
+
+@njit("float64(float64, float64, float64, float64, float64, float64, float64)", cache=True, fastmath=True)
+def crater_scaling_km(rho_i, rho_t, d_m, v_kms, gravity_term, angle_term, slope_factor):
+    """Crater diameter in km before the land/ocean constant is applied."""
+    velocity_ms = v_kms * 1_000.0
+    density_term = (rho_i / rho_t) ** (1.0 / 3.0)
+    diameter_term = d_m ** 0.78
+    velocity_term = velocity_ms ** 0.44
+    crater_m = density_term * diameter_term * velocity_term * gravity_term * angle_term * slope_factor
+    return crater_m / 1_000.0
+
+
+@njit("float64(float64)", cache=True, fastmath=True)
+def thermal_radius_km(E_joules):
+    if E_joules <= 0:
+        return 0.0
+    radius_m = math.sqrt(_THERMAL_OVER_TWO_PI_FLUX * E_joules)
+    return radius_m / 1_000.0
+
+
+@njit("float64(float64, float64)", cache=True, fastmath=True)
+def thermal_flux_at_distance_jm2(E_joules, distance_km):
+    if E_joules <= 0 or distance_km <= 0:
+        return 0.0
+    distance_m = distance_km * 1_000.0
+    return _THERMAL_OVER_TWO_PI * E_joules / (distance_m * distance_m)
+
+
+@njit("float64(float64, float64)", cache=True, fastmath=True)
+def shock_radius_km(E_joules, density_factor):
+    if E_joules <= 0:
+        return 0.0
+    density_factor = max(density_factor, 0.5)
+    return 1.8 * (E_joules * INV_MEGATON_J) ** (1.0 / 3.0) * density_factor ** -0.1
+
+
+@njit("float64(float64, float64, float64)", cache=True, fastmath=True)
+def tsunami_height_m(E_joules, distance_km, water_depth_m):
+    if E_joules <= 0:
+        return 0.0
+    E_mt = E_joules * INV_MEGATON_J
+    if E_mt < 1:
+        return 0.5
+    depth_factor = 1.0
+    if water_depth_m >= 0:
+        depth_factor = min(1.0, max(0.35, water_depth_m / 4_000.0))
+    return min(80.0, 0.12 * (E_mt ** 0.5) * depth_factor * (50.0 / max(distance_km, 1.0)) ** 0.5)
+
+
+@njit("float64(float64)", cache=True, fastmath=True)
+def seismic_magnitude(E_joules):
+    if E_joules <= 0:
+        return 0.0
+    return 0.67 * math.log10(E_joules) - 5.87
+
+
+def warm_up() -> None:
+    """Compile every kernel ahead of the first request."""
+    energy = energy_joules(100.0, 3000.0, 20.0)
+    crater_scaling_km(3000.0, 2700.0, 100.0, 20.0, 0.6, 0.9, 1.0)
+    thermal_radius_km(energy)
+    thermal_flux_at_distance_jm2(energy, 100.0)
+    shock_radius_km(energy, 1.0)
+    tsunami_height_m(energy, 50.0, NO_WATER_DEPTH)
+    seismic_magnitude(energy)
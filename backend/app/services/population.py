@@ -1,33 +1,89 @@
 ﻿from __future__ import annotations
 
-from functools import lru_cache
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import httpx
 
+from app.services import cache
+from app.services.http_client import get_client
+
 WORLD_BANK_INDICATOR_URL = "https://api.worldbank.org/v2/country/{country}/indicator/EN.POP.DNST"
 DEFAULT_TIMEOUT = 10.0
+CACHE_TTL = 30 * 24 * 3600  # World Bank updates the indicator yearly
+PREWARM_PAGE_SIZE = 500
+
+_DENSITY_CACHE: Dict[str, float] = {}
 
 class PopulationDensityError(RuntimeError):
     """Raised when population density data cannot be retrieved."""
 
-@lru_cache(maxsize=128)
-def get_population_density(country_code: str, lookback: int = 20) -> float:
+async def get_population_density(country_code: str, lookback: int = 20) -> float:
     if not country_code:
         raise PopulationDensityError("Country code required for population density lookup")
     country = country_code.strip().lower()
     if len(country) != 2:
         country = country[:2]
+    cached = _DENSITY_CACHE.get(country)
+    if cached is not None:
+        return cached
+    key = _cache_key(country)
+    shared = await cache.get_json(key)
+    if shared is not None:
+        density = float(shared)
+    else:
+        density = await _fetch_population_density(country, lookback)
+        await cache.set_json(key, CACHE_TTL, density)
+    _DENSITY_CACHE[country] = density
+    return density
+
+
+def _cache_key(country: str) -> str:
+    return f"wb:popdens:{country}"
+
+
+async def prewarm_population_cache() -> None:
+    """Load the latest density of every country with one bulk World Bank request."""
+    params = {
+        "format": "json",
+        "mrnev": "1",
+        "per_page": str(PREWARM_PAGE_SIZE),
+    }
+    url = WORLD_BANK_INDICATOR_URL.format(country="all")
+    try:
+        response = await get_client().get(url, params=params, timeout=DEFAULT_TIMEOUT)
+        response.raise_for_status()
+        payload = response.json()
+    except (httpx.HTTPError, ValueError):
+        return
+    if not isinstance(payload, list) or len(payload) < 2 or not isinstance(payload[1], list):
+        return
+    for entry in payload[1]:
+        country = _entry_country(entry)
+        value = entry.get("value") if isinstance(entry, dict) else None
+        if country and isinstance(value, (int, float)):
+            _DENSITY_CACHE[country] = float(value)
+            await cache.set_json(_cache_key(country), CACHE_TTL, float(value))
+
+
+def _entry_country(entry: Any) -> Optional[str]:
+    if not isinstance(entry, dict) or not isinstance(entry.get("country"), dict):
+        return None
+    code = entry["country"].get("id")
+    if isinstance(code, str) and len(code) == 2 and code.isalpha():
+        return code.lower()
+    return None
+
+
+async def _fetch_population_density(country: str, lookback: int) -> float:
     params = {
         "format": "json",
         "per_page": str(lookback),
     }
     url = WORLD_BANK_INDICATOR_URL.format(country=country)
     try:
-        with httpx.Client(timeout=DEFAULT_TIMEOUT) as client:
-            response = client.get(url, params=params)
-            response.raise_for_status()
-            payload = response.json()
+        response = await get_client().get(url, params=params, timeout=DEFAULT_TIMEOUT)
+        response.raise_for_status()
+        payload = response.json()
     except httpx.HTTPError as exc:
         raise PopulationDensityError(f"World Bank API request failed: {exc}") from exc
     if not isinstance(payload, list) or len(payload) < 2:
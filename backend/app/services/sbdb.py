@@ -1,13 +1,29 @@
 ﻿from __future__ import annotations
 
+import asyncio
+import atexit
+import contextlib
 import json
+import math
+import os
 import re
+import tempfile
+import threading
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
 import httpx
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback when orjson is unavailable
+    orjson = None
 
 SUMMARY_URL = "https://ssd-api.jpl.nasa.gov/sbdb_query.api"
 SUMMARY_PARAMS = {
@@ -23,6 +39,43 @@ DETAIL_CACHE_DIR = CACHE_DIR / "details"
 NUMERIC_RE = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
 DEFAULT_DENSITY_KGM3 = 3000.0
 DEFAULT_ANGLE_DEG = 45.0
+_VI_FLOAT_KEYS = ("ip", "ps", "ts", "energy", "dist", "v_inf", "v_imp", "h", "diam", "mass")  # VIEntry field order
+_SUMMARY_COLUMNS = ("spkid", "full_name", "H", "h", "diameter", "density", "ip", "ps", "ts", "pha", "PHA")
+SUMMARY_TABLE_DTYPE = np.dtype(
+    [
+        ("spkid", object),
+        ("full_name", object),
+        ("impact_probability", np.float64),
+        ("palermo_scale", np.float64),
+        ("torino_scale", np.float64),
+        ("diameter_km", np.float64),
+        ("density_gcm3", np.float64),
+        ("absolute_magnitude_h", np.float64),
+        ("pha", object),
+    ]
+)
+
+_summary_table: Optional[tuple[int, np.ndarray]] = None
+_normalize_pool: Optional[ProcessPoolExecutor] = None
+
+# In-process copies of the disk cache, stamped with the cache file's mtime so both expire together.
+DETAIL_MEMORY_MAX = 1024
+BULK_NORMALIZE_PROCESS_MIN = 512  # below this, pickling to worker processes costs more than it saves
+_summary_memory: Optional[tuple[float, List[Dict[str, Any]]]] = None
+_summary_lock = threading.Lock()
+_detail_memory: Dict[str, tuple[float, Dict[str, Any]]] = {}
+_detail_lock = threading.Lock()
+
+
+# One pooled HTTP/2 client for every SBDB call, so keep-alive connections are reused.
+_CLIENT_OPTIONS: Dict[str, Any] = {
+    "http2": True,
+    "timeout": 30,
+    "headers": {"accept-encoding": "gzip"},
+    "limits": httpx.Limits(max_keepalive_connections=20, max_connections=40),
+}
+_CLIENT = httpx.Client(**_CLIENT_OPTIONS)
+atexit.register(_CLIENT.close)
 
 
 class NasaServiceError(RuntimeError):
@@ -106,6 +159,7 @@ class DetailRecord:
     reported_mass_kg: Optional[float]
     vi_data: List[Dict[str, Any]]
     source: str = "NASA SBDB"
+    orbit_elements: Optional[Dict[str, float]] = None
 
     def as_dict(self) -> Dict[str, Any]:
         return {
@@ -124,6 +178,7 @@ class DetailRecord:
             "reported_mass_kg": self.reported_mass_kg,
             "vi_data": self.vi_data,
             "source": self.source,
+            "orbit_elements": self.orbit_elements,
         }
 
 
@@ -143,14 +198,90 @@ def _is_fresh(path: Path, now: Optional[float] = None) -> bool:
 
 
 def _load_json(path: Path) -> Any:
+    """Decode a cache file, reusing the last decode until the file is rewritten or touched.
+
+    The payload is shared between callers, so it must not be mutated.
+    """
+    stat = path.stat()
+    return _load_json_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    path = Path(path_str)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as fp:
         return json.load(fp)
 
 
+def _default_file_mode() -> int:
+    # os.umask can only be read by setting it; do it once, at import, before any worker thread exists.
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# mkstemp creates 0600 files; cache files get the mode a plain open() would have given them.
+_CACHE_FILE_MODE = _default_file_mode()
+
+
 def _save_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fp:
-        json.dump(payload, fp, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    # Write a sibling temp file and rename it over the target, so readers never see a partial file.
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(data)
+        os.chmod(tmp_name, _CACHE_FILE_MODE)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _response_json(response: httpx.Response) -> Any:
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _load_cache(path: Path) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    try:
+        cached = _load_json(path)
+    except (OSError, ValueError):
+        # Unreadable or truncated file: treat it as missing so it gets refetched and overwritten.
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def _conditional_headers(cached: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def _validators(response: httpx.Response) -> Dict[str, Optional[str]]:
+    return {
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+    }
+
+
+def _revalidated(path: Path) -> None:
+    """Mark a cache entry fresh again after SBDB answered 304 Not Modified."""
+    os.utime(path, None)
 
 
 def _to_float(value: Any) -> Optional[float]:
@@ -159,13 +290,28 @@ def _to_float(value: Any) -> Optional[float]:
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, str):
-        cleaned = value.strip().replace(",", "")
-        match = NUMERIC_RE.search(cleaned)
-        if match:
-            try:
-                return float(match.group(0))
-            except ValueError:
-                return None
+        return _to_float_str(value)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _to_float_str(value: str) -> Optional[float]:
+    # Clean SBDB literals parse directly; nan/inf and "1_000" still go through the regex as before.
+    if "_" not in value:
+        try:
+            number = float(value)
+        except ValueError:
+            pass
+        else:
+            if math.isfinite(number):
+                return number
+    cleaned = value.strip().replace(",", "")
+    match = NUMERIC_RE.search(cleaned)
+    if match:
+        try:
+            return float(match.group(0))
+        except ValueError:
+            return None
     return None
 
 
@@ -183,78 +329,129 @@ def _extract_phys_value(raw: Any, key: str) -> Optional[float]:
     return None
 
 
-def _normalize_summary_rows(fields: Iterable[str], rows: Iterable[Iterable[Any]]) -> List[SummaryRecord]:
+def _normalize_summary_rows(fields: Iterable[str], rows: Iterable[Sequence[Any]]) -> List[SummaryRecord]:
     normalized: List[SummaryRecord] = []
     field_list = list(fields)
+    width = len(field_list)
+    positions = {name: index for index, name in enumerate(field_list)}
+
+    def column(name: str) -> Callable[[Sequence[Any]], Any]:
+        # Missing columns read as "", matching the old dict.get(..., "") lookups.
+        index = positions.get(name)
+        return itemgetter(index) if index is not None else (lambda row: "")
+
+    (
+        get_spkid, get_full_name, get_h_upper, get_h_lower, get_diameter,
+        get_density, get_ip, get_ps, get_ts, get_pha_lower, get_pha_upper,
+    ) = map(column, _SUMMARY_COLUMNS)
     for row in rows:
-        mapping = dict(zip(field_list, row))
-        spkid = str(mapping.get("spkid", "")).strip()
-        full_name = str(mapping.get("full_name", "")).strip()
+        if len(row) < width:
+            row = [*row, *[""] * (width - len(row))]
+        spkid = str(get_spkid(row)).strip()
+        full_name = str(get_full_name(row)).strip()
         if not spkid or not full_name:
             continue
         record = SummaryRecord(
             spkid=spkid,
             full_name=full_name,
-            absolute_magnitude_h=_to_float(mapping.get("H") or mapping.get("h")),
-            diameter_km=_to_float(mapping.get("diameter")),
-            density_gcm3=_to_float(mapping.get("density")),
-            impact_probability=_to_float(mapping.get("ip")),
-            palermo_scale=_to_float(mapping.get("ps")),
-            torino_scale=_to_float(mapping.get("ts")),
-            pha=(mapping.get("pha") or mapping.get("PHA") or None),
+            absolute_magnitude_h=_to_float(get_h_upper(row) or get_h_lower(row)),
+            diameter_km=_to_float(get_diameter(row)),
+            density_gcm3=_to_float(get_density(row)),
+            impact_probability=_to_float(get_ip(row)),
+            palermo_scale=_to_float(get_ps(row)),
+            torino_scale=_to_float(get_ts(row)),
+            pha=(get_pha_lower(row) or get_pha_upper(row) or None),
         )
         normalized.append(record)
     return normalized
 
 
+def _from_memory(entry: Optional[tuple[float, Any]]) -> Any:
+    if entry is not None and time.time() - entry[0] < CACHE_MAX_AGE:
+        return entry[1]
+    return None
+
+
 def fetch_summary(refresh: bool = False) -> List[Dict[str, Any]]:
+    global _summary_memory
+    if not refresh:
+        items = _from_memory(_summary_memory)
+        if items is not None:
+            return items
+    # One thread loads or downloads the summary while the others wait for its result.
+    with _summary_lock:
+        if not refresh:
+            items = _from_memory(_summary_memory)
+            if items is not None:
+                return items
+        items = _fetch_summary(refresh)
+        _summary_memory = (SUMMARY_CACHE.stat().st_mtime, items)
+    return items
+
+
+def _fetch_summary(refresh: bool) -> List[Dict[str, Any]]:
     _ensure_directories()
-    if not refresh and _is_fresh(SUMMARY_CACHE):
-        cached = _load_json(SUMMARY_CACHE)
-        if isinstance(cached, dict) and "items" in cached:
-            return cached["items"]
+    cached = _load_cache(SUMMARY_CACHE)
+    if cached is not None and "items" not in cached:
+        cached = None
+    if cached is not None and not refresh and _is_fresh(SUMMARY_CACHE):
+        return cached["items"]
     try:
-        with httpx.Client(timeout=30) as client:
-            response = client.get(SUMMARY_URL, params=SUMMARY_PARAMS)
+        response = _CLIENT.get(SUMMARY_URL, params=SUMMARY_PARAMS, headers=_conditional_headers(cached))
+        if response.status_code == 304 and cached is not None:
+            _revalidated(SUMMARY_CACHE)
+            return cached["items"]
         response.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise NasaServiceError(f"SBDB summary request failed: {exc}") from exc
     except httpx.HTTPError as exc:
         raise NasaServiceError(f"SBDB summary request error: {exc}") from exc
 
-    payload = response.json()
+    payload = _response_json(response)
     records = _normalize_summary_rows(payload.get("fields", []), payload.get("data", []))
     items = [record.as_dict() for record in records]
-    _save_json(SUMMARY_CACHE, {"fetched_at": time.time(), "items": items})
+    _save_json(SUMMARY_CACHE, {"fetched_at": time.time(), "items": items, **_validators(response)})
     return items
 
 
+def _float_column(values: List[Any]) -> List[Optional[float]]:
+    """Convert one VI column in a single numpy pass, deferring to _to_float wherever numpy is not enough."""
+    if any(isinstance(value, str) and "_" in value for value in values):
+        return [_to_float(value) for value in values]
+    try:
+        column = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    except (TypeError, ValueError):
+        return [_to_float(value) for value in values]
+    if column.shape != (len(values),):  # list-valued cells
+        return [_to_float(value) for value in values]
+    converted = column.tolist()
+    # None, nan/inf and overflowing literals keep the scalar parser's answer.
+    for index in np.flatnonzero(~np.isfinite(column)).tolist():
+        converted[index] = _to_float(values[index])
+    return converted
+
+
 def _normalize_vi_data(raw_vi: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    normalized: List[Dict[str, Any]] = []
-    for entry in raw_vi or []:
-        if not isinstance(entry, dict):
-            continue
-        vi = VIEntry(
-            date=entry.get("date"),
-            ip=_to_float(entry.get("ip")),
-            ps=_to_float(entry.get("ps")),
-            ts=_to_float(entry.get("ts")),
-            energy_mt=_to_float(entry.get("energy")),
-            distance_au=_to_float(entry.get("dist")),
-            v_inf_kms=_to_float(entry.get("v_inf")),
-            v_imp_kms=_to_float(entry.get("v_imp")),
-            h_mag=_to_float(entry.get("h")),
-            diameter_m=_to_float(entry.get("diam")),
-            mass_kg=_to_float(entry.get("mass")),
-        )
-        normalized.append(vi.as_dict())
-    return normalized
+    entries = [entry for entry in raw_vi or [] if isinstance(entry, dict)]
+    if not entries:
+        return []
+    columns = [_float_column([entry.get(key) for entry in entries]) for key in _VI_FLOAT_KEYS]
+    return [
+        VIEntry(entry.get("date"), *values).as_dict()
+        for entry, values in zip(entries, zip(*columns))
+    ]
 
 
 def _select_primary_vi(entries: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     if not entries:
         return None
-    return max(entries, key=lambda e: e.get("impact_probability") or 0.0)
+    best = entries[0]
+    best_ip = best.get("impact_probability") or 0.0
+    for entry in entries[1:]:
+        ip = entry.get("impact_probability") or 0.0
+        if ip > best_ip:
+            best, best_ip = entry, ip
+    return best
 
 
 def _convert_density(value: Optional[float]) -> Optional[float]:
@@ -299,6 +496,7 @@ def _normalize_detail(raw: Dict[str, Any], spkid: str) -> DetailRecord:
 
     absolute_mag = _to_float(obj.get("h") or obj.get("H"))
     pha = obj.get("pha") if isinstance(obj, dict) else None
+    orbit = raw.get("orbit") if isinstance(raw, dict) else None
 
     return DetailRecord(
         spkid=str(spkid),
@@ -315,56 +513,277 @@ def _normalize_detail(raw: Dict[str, Any], spkid: str) -> DetailRecord:
         reported_energy_mt=reported_energy_mt,
         reported_mass_kg=reported_mass_kg,
         vi_data=vi_data,
+        orbit_elements=_extract_orbit_mapping(orbit) if orbit else None,
     )
 
 
-def fetch_detail(spkid: str, refresh: bool = False) -> Dict[str, Any]:
-    if not spkid:
-        raise ValueError("spkid is required")
-    _ensure_directories()
-    cache_path = DETAIL_CACHE_DIR / f"{spkid}.json"
-    if not refresh and _is_fresh(cache_path):
-        cached = _load_json(cache_path)
-        if isinstance(cached, dict):
-            if "normalized" in cached:
-                return cached["normalized"]
-            if "data" in cached:
-                return _normalize_detail(cached["data"], spkid).as_dict()
-
-    params = {
+def _cached_detail(cached: Dict[str, Any], spkid: str, cache_path: Path) -> Dict[str, Any]:
+    normalized = cached.get("normalized")
+    raw_payload = cached.get("data")
+    if raw_payload is None or (normalized is not None and "orbit_elements" in normalized):
+        return normalized
+    # Older entry that still carries the raw payload: normalize it once and rewrite the entry
+    # without it, keeping the entry's age.
+    normalized = _normalize_detail(raw_payload, spkid).as_dict()
+    migrated = {key: value for key, value in cached.items() if key != "data"}
+    migrated["normalized"] = normalized
+    try:
+        stat = cache_path.stat()
+        _save_json(cache_path, migrated)
+        os.utime(cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    except OSError:
+        pass
+    return normalized
+
+
+def _detail_cache_path(spkid: str) -> Path:
+    return DETAIL_CACHE_DIR / f"{spkid}.json"
+
+
+def _load_detail_cache(cache_path: Path) -> Optional[Dict[str, Any]]:
+    cached = _load_cache(cache_path)
+    if cached is not None and "normalized" not in cached and "data" not in cached:
+        return None
+    return cached
+
+
+def _detail_params(spkid: str) -> Dict[str, str]:
+    return {
         "sstr": str(spkid),
         "phys-par": "1",
         "vi-data": "1",
         "discovery": "1",
     }
-    try:
-        with httpx.Client(timeout=30) as client:
-            response = client.get(DETAIL_URL, params=params)
-        if response.status_code == 404:
-            raise NasaResourceNotFound(f"Asteroid with spkid={spkid} not found")
-        response.raise_for_status()
-    except httpx.HTTPStatusError as exc:
-        raise NasaServiceError(f"SBDB detail request failed: {exc}") from exc
-    except httpx.HTTPError as exc:
-        raise NasaServiceError(f"SBDB detail request error: {exc}") from exc
 
-    raw_payload = response.json()
+
+def _raise_for_detail_status(response: httpx.Response, spkid: str) -> None:
+    if response.status_code == 404:
+        raise NasaResourceNotFound(f"Asteroid with spkid={spkid} not found")
+    response.raise_for_status()
+
+
+def _detail_payload(response: httpx.Response) -> Any:
+    raw_payload = _response_json(response)
     if isinstance(raw_payload, dict) and raw_payload.get("message"):
         message = raw_payload.get("message")
         if "not found" in str(message).lower():
             raise NasaResourceNotFound(str(message))
+    return raw_payload
 
-    normalized = _normalize_detail(raw_payload, spkid)
-    _save_json(cache_path, {
+
+def _detail_cache_entry(normalized: Dict[str, Any], response: httpx.Response) -> Dict[str, Any]:
+    return {
         "fetched_at": time.time(),
-        "data": raw_payload,
-        "normalized": normalized.as_dict(),
-    })
-    return normalized.as_dict()
+        "normalized": normalized,
+        **_validators(response),
+    }
+
+
+def fetch_detail(spkid: str, refresh: bool = False) -> Dict[str, Any]:
+    if not spkid:
+        raise ValueError("spkid is required")
+    if not refresh:
+        detail = _from_memory(_detail_memory.get(spkid))
+        if detail is not None:
+            return detail
+    detail = _fetch_detail(spkid, refresh)
+    _remember_detail(spkid, detail)
+    return detail
+
+
+def _remember_detail(spkid: str, detail: Dict[str, Any]) -> None:
+    """Keep ``detail`` in memory, stamped with the mtime of the cache file just written."""
+    stamp = _detail_cache_path(spkid).stat().st_mtime
+    with _detail_lock:
+        _detail_memory.pop(spkid, None)
+        if len(_detail_memory) >= DETAIL_MEMORY_MAX:
+            del _detail_memory[next(iter(_detail_memory))]
+        _detail_memory[spkid] = (stamp, detail)
+
+
+def _fetch_detail(spkid: str, refresh: bool) -> Dict[str, Any]:
+    _ensure_directories()
+    cache_path = _detail_cache_path(spkid)
+    cached = _load_detail_cache(cache_path)
+    if cached is not None and not refresh and _is_fresh(cache_path):
+        return _cached_detail(cached, spkid, cache_path)
+
+    try:
+        response = _CLIENT.get(DETAIL_URL, params=_detail_params(spkid), headers=_conditional_headers(cached))
+        if response.status_code == 304 and cached is not None:
+            _revalidated(cache_path)
+            return _cached_detail(cached, spkid, cache_path)
+        _raise_for_detail_status(response, spkid)
+    except httpx.HTTPStatusError as exc:
+        raise NasaServiceError(f"SBDB detail request failed: {exc}") from exc
+    except httpx.HTTPError as exc:
+        raise NasaServiceError(f"SBDB detail request error: {exc}") from exc
+
+    normalized = _normalize_detail(_detail_payload(response), spkid).as_dict()
+    _save_json(cache_path, _detail_cache_entry(normalized, response))
+    return normalized
+
+
+async def _fetch_detail_async(
+    client: httpx.AsyncClient, spkid: str
+) -> tuple[Optional[Dict[str, Any]], Optional[httpx.Response]]:
+    """Return the cached detail if SBDB answers 304, otherwise the response still to be normalized."""
+    cache_path = _detail_cache_path(spkid)
+    cached = await asyncio.to_thread(_load_detail_cache, cache_path)
+    try:
+        response = await client.get(DETAIL_URL, params=_detail_params(spkid), headers=_conditional_headers(cached))
+        if response.status_code == 304 and cached is not None:
+            return await asyncio.to_thread(_revalidated_detail, cached, spkid, cache_path), None
+        _raise_for_detail_status(response, spkid)
+    except httpx.HTTPStatusError as exc:
+        raise NasaServiceError(f"SBDB detail request failed: {exc}") from exc
+    except httpx.HTTPError as exc:
+        raise NasaServiceError(f"SBDB detail request error: {exc}") from exc
+    return None, response
+
+
+def _revalidated_detail(cached: Dict[str, Any], spkid: str, cache_path: Path) -> Dict[str, Any]:
+    _revalidated(cache_path)
+    return _cached_detail(cached, spkid, cache_path)
+
+
+def _fresh_details(spkids: List[str], refresh: bool) -> tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """Split spkids into details served from fresh cache entries and the ones still to download."""
+    found: Dict[str, Dict[str, Any]] = {}
+    pending: List[str] = []
+    for spkid in spkids:
+        cache_path = _detail_cache_path(spkid)
+        cached = _load_detail_cache(cache_path) if not refresh and _is_fresh(cache_path) else None
+        if cached is not None:
+            found[spkid] = _cached_detail(cached, spkid, cache_path)
+        else:
+            pending.append(spkid)
+    return found, pending
+
+
+def _normalize_detail_worker(item: tuple[str, Any]) -> Dict[str, Any]:
+    spkid, raw_payload = item
+    return _normalize_detail(raw_payload, spkid).as_dict()
+
+
+def _normalize_detail_chunk(items: List[tuple[str, Any]]) -> List[Dict[str, Any]]:
+    return [_normalize_detail_worker(item) for item in items]
+
+
+def _parse_details(
+    responses: List[tuple[str, httpx.Response]],
+) -> tuple[List[tuple[str, Any]], List[httpx.Response]]:
+    items: List[tuple[str, Any]] = []
+    kept: List[httpx.Response] = []
+    for spkid, response in responses:
+        try:
+            items.append((spkid, _detail_payload(response)))
+        except NasaResourceNotFound:
+            continue
+        kept.append(response)
+    return items, kept
+
+
+def _save_details(items: List[tuple[str, Any]], normalized: List[Dict[str, Any]], kept: List[httpx.Response]) -> None:
+    for (spkid, _), detail, response in zip(items, normalized, kept):
+        _save_json(_detail_cache_path(spkid), _detail_cache_entry(detail, response))
+        _remember_detail(spkid, detail)
+
+
+def _get_normalize_pool() -> ProcessPoolExecutor:
+    """Process pool shared by every bulk fetch; created once, from the event loop thread."""
+    global _normalize_pool
+    if _normalize_pool is None:
+        _normalize_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        atexit.register(_normalize_pool.shutdown, cancel_futures=True)
+    return _normalize_pool
+
+
+async def _store_details(
+    responses: List[tuple[str, httpx.Response]],
+    pool: Optional[Executor] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Normalize downloaded details, across processes for large batches, and write their cache entries."""
+    items, kept = await asyncio.to_thread(_parse_details, responses)
+
+    if len(items) < BULK_NORMALIZE_PROCESS_MIN or (os.cpu_count() or 1) < 2:
+        normalized = await asyncio.to_thread(_normalize_detail_chunk, items)
+    else:
+        pool = pool or _get_normalize_pool()
+        loop = asyncio.get_running_loop()
+        step = -(-len(items) // os.cpu_count())
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, _normalize_detail_chunk, items[start:start + step])
+                for start in range(0, len(items), step)
+            )
+        )
+        normalized = [detail for chunk in chunks for detail in chunk]
+
+    await asyncio.to_thread(_save_details, items, normalized, kept)
+    return {spkid: detail for (spkid, _), detail in zip(items, normalized)}
+
+
+async def fetch_details_many(
+    spkids: Iterable[str],
+    concurrency: int = 20,
+    refresh: bool = False,
+    failures: Optional[Dict[str, NasaServiceError]] = None,
+    pool: Optional[Executor] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch several details concurrently over one HTTP/2 connection.
+
+    Fresh cache entries are served without a request and asteroids SBDB does
+    not know are left out of the result, which keeps the input order. A failed
+    download only drops its own spkid; pass ``failures`` to collect the errors.
+    Large batches are normalized on ``pool``, or on a module-wide process pool
+    when none is given.
+    """
+    _ensure_directories()
+    wanted = [str(spkid) for spkid in dict.fromkeys(spkids) if spkid]
+    found, pending = await asyncio.to_thread(_fresh_details, wanted, refresh)
+
+    if pending:
+        semaphore = asyncio.Semaphore(concurrency)
+        async with httpx.AsyncClient(**_CLIENT_OPTIONS) as client:
+
+            async def bounded(spkid: str) -> tuple[Optional[Dict[str, Any]], Optional[httpx.Response]]:
+                async with semaphore:
+                    try:
+                        return await _fetch_detail_async(client, spkid)
+                    except NasaResourceNotFound:
+                        return None, None
+                    except NasaServiceError as exc:
+                        if failures is not None:
+                            failures[spkid] = exc
+                        return None, None
+
+            fetched = await asyncio.gather(*(bounded(spkid) for spkid in pending))
+        downloaded: List[tuple[str, httpx.Response]] = []
+        for spkid, (detail, response) in zip(pending, fetched):
+            if detail is not None:
+                found[spkid] = detail
+            elif response is not None:
+                downloaded.append((spkid, response))
+        if downloaded:
+            found.update(await _store_details(downloaded, pool))
+
+    return {spkid: found[spkid] for spkid in wanted if spkid in found}
+
+
+def fetch_details_bulk(
+    spkids: Iterable[str],
+    concurrency: int = 20,
+    refresh: bool = False,
+    failures: Optional[Dict[str, NasaServiceError]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    return asyncio.run(
+        fetch_details_many(spkids, concurrency=concurrency, refresh=refresh, failures=failures)
+    )
 
 
 def get_detail(spkid: str, refresh: bool = False) -> Dict[str, Any]:
-    payload = fetch_detail(spkid, refresh=refresh)
+    payload = dict(fetch_detail(spkid, refresh=refresh))
     if "density_kgm3" not in payload or payload["density_kgm3"] is None:
         payload["density_kgm3"] = DEFAULT_DENSITY_KGM3
     if payload.get("velocity_kms") in (None, 0):
@@ -401,28 +820,26 @@ def _extract_orbit_mapping(orbit: Any) -> dict[str, float]:
 
 
 def get_orbit_elements(spkid: str, refresh: bool = False) -> dict[str, float]:
+    """Keplerian elements for ``spkid``, read from the normalized detail.
+
+    The orbit mapping is extracted once when the detail is normalized and kept
+    under ``orbit_elements``, so the raw SBDB payload is never parsed again here.
+    """
     if not spkid:
         raise ValueError("spkid is required")
-    _ensure_directories()
-    cache_path = DETAIL_CACHE_DIR / f"{spkid}.json"
-    if refresh or not _is_fresh(cache_path):
-        fetch_detail(spkid, refresh=refresh)
-    else:
-        try:
-            fetch_detail(spkid, refresh=False)
-        except NasaServiceError:
-            fetch_detail(spkid, refresh=True)
-    raw_payload: dict[str, Any] | None = None
-    if cache_path.exists():
-        cached = _load_json(cache_path)
-        if isinstance(cached, dict):
-            raw_payload = cached.get("data")
-    if not isinstance(raw_payload, dict):
+    try:
+        detail = fetch_detail(spkid, refresh=refresh)
+    except NasaResourceNotFound:
+        raise
+    except NasaServiceError:
+        if refresh:
+            raise
+        detail = fetch_detail(spkid, refresh=True)
+    if "orbit_elements" not in detail:
         raise NasaServiceError("Orbit data not available")
-    orbit_data = raw_payload.get("orbit")
-    if not orbit_data:
+    mapping = detail["orbit_elements"]
+    if mapping is None:
         return {}
-    mapping = _extract_orbit_mapping(orbit_data)
 
     def _pick(*keys: str) -> float | None:
         for key in keys:
@@ -455,3 +872,24 @@ def get_summary(refresh: bool = False) -> List[Dict[str, Any]]:
     return items
 
 
+def _build_summary_table(items: List[Dict[str, Any]]) -> np.ndarray:
+    table = np.empty(len(items), dtype=SUMMARY_TABLE_DTYPE)
+    for name in SUMMARY_TABLE_DTYPE.names:
+        values = [item.get(name) for item in items]
+        if SUMMARY_TABLE_DTYPE[name] == np.float64:
+            values = [np.nan if value is None else value for value in values]
+        table[name] = values
+    return table
+
+
+def get_summary_table(refresh: bool = False) -> np.ndarray:
+    """Summary items as a structured array (missing floats are NaN), rebuilt only when the cache file changes."""
+    global _summary_table
+    items = get_summary(refresh=refresh)
+    try:
+        version = SUMMARY_CACHE.stat().st_mtime_ns
+    except OSError:
+        return _build_summary_table(items)
+    if _summary_table is None or _summary_table[0] != version:
+        _summary_table = (version, _build_summary_table(items))
+    return _summary_table[1]
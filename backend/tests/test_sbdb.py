@@ -0,0 +1,36 @@
+import httpx
+
+from app.services import sbdb
+
+
+def _payload(full_name):
+    return {
+        "object": {"fullname": full_name, "spkid": "2099942"},
+        "orbit": {"elements": [
+            {"name": "a", "value": "0.922"},
+            {"name": "e", "value": "0.191"},
+            {"name": "i", "value": "3.34"},
+            {"name": "om", "value": "204"},
+            {"name": "w", "value": "127"},
+        ]},
+    }
+
+
+def test_bulk_refresh_replaces_remembered_detail(tmp_path, monkeypatch):
+    names = iter(["99942 Apophis (2004 MN4)", "RENAMED 99942"])
+
+    def handler(request):
+        return httpx.Response(200, json=_payload(next(names)))
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(sbdb, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(sbdb, "DETAIL_CACHE_DIR", tmp_path / "details")
+    monkeypatch.setattr(sbdb, "_CLIENT", httpx.Client(transport=transport))
+    monkeypatch.setattr(sbdb, "_CLIENT_OPTIONS", {"transport": transport})
+    monkeypatch.setattr(sbdb, "_detail_memory", {})
+
+    assert sbdb.fetch_detail("99942")["full_name"] == "99942 Apophis (2004 MN4)"
+    refreshed = sbdb.fetch_details_bulk(["99942"], refresh=True)
+
+    assert refreshed["99942"]["full_name"] == "RENAMED 99942"
+    assert sbdb.fetch_detail("99942")["full_name"] == "RENAMED 99942"
@@ -1,11 +1,11 @@
 import os
 import re
-import requests
+import httpx
 import numpy as np
 import pandas as pd
 from urllib.parse import quote
 import plotly.graph_objects as go
-from dash import Dash, html, dcc, Output, Input
+from dash import Dash, html, dcc, Output, Input, State, ClientsideFunction
 
 # -----------------------------
 # Configuración inicial
@@ -14,27 +14,44 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CSV_ABSOLUTA = os.path.join(BASE_DIR, "cneos_sentry_summary_data.csv")
 HEAD_LIMIT = 1994
 EMERGENCY_LIST = ["433 Eros", "99942 Apophis"]
+BASE_TITLE = "Órbita 3D del Sistema Solar Interior"
+COLUMNAS_EXACTAS = ("object designation", "object_designation", "des", "object_name")
+TOKENS_COLUMNA = ("design", "object", "name", "des")
+MENSAJE_INICIAL = "🌍 Selecciona un asteroide para mostrar su órbita."
+HTTP_CLIENT = httpx.Client(http2=True, timeout=10)
 
 # -----------------------------
 # Leer CSV o usar lista de respaldo
 # -----------------------------
-try:
-    df = pd.read_csv(CSV_ABSOLUTA)
-    df.columns = [c.strip() for c in df.columns]
-    posibles = [col for col in df.columns if any(token in col.lower() for token in ["design", "object", "name", "des"])]
-    COLUMN_NAME = posibles[0] if posibles else df.columns[0]
-    ASTEROIDES_PARA_MENU = df[COLUMN_NAME].dropna().astype(str).str.strip().head(HEAD_LIMIT).tolist()
-    if not ASTEROIDES_PARA_MENU:
-        ASTEROIDES_PARA_MENU = EMERGENCY_LIST
-except Exception:
-    ASTEROIDES_PARA_MENU = EMERGENCY_LIST
-
 # Limpieza de nombres
+_LEADING_NUM_RE = re.compile(r"^\d+\s*")
+_PAREN_RE = re.compile(r"[()]")
+
 def limpiar_nombre(nombre):
-    nombre = re.sub(r"^\d+\s*", "", nombre)
-    return nombre.replace("(", "").replace(")", "").strip()
+    return _PAREN_RE.sub("", _LEADING_NUM_RE.sub("", nombre)).strip()
 
-ASTEROIDES_PARA_MENU = [limpiar_nombre(n) for n in ASTEROIDES_PARA_MENU]
+try:
+    # Primero solo el encabezado, para leer únicamente la columna de nombres.
+    encabezado = {c.strip(): c for c in pd.read_csv(CSV_ABSOLUTA, nrows=0).columns}
+    minusculas = {c.lower(): c for c in encabezado}
+    # Nombres conocidos por búsqueda directa; si no hay, la búsqueda por fragmentos de siempre.
+    COLUMN_NAME = next((minusculas[k] for k in COLUMNAS_EXACTAS if k in minusculas), None)
+    if COLUMN_NAME is None:
+        posibles = [col for low, col in minusculas.items() if any(token in low for token in TOKENS_COLUMNA)]
+        COLUMN_NAME = posibles[0] if posibles else next(iter(encabezado))
+    nombres = pd.read_csv(CSV_ABSOLUTA, usecols=[encabezado[COLUMN_NAME]], dtype=str, engine="c").iloc[:, 0]
+    nombres = nombres.dropna().str.strip().head(HEAD_LIMIT)
+    if nombres.empty:
+        ASTEROIDES_PARA_MENU = list(map(limpiar_nombre, EMERGENCY_LIST))
+    else:
+        nombres = (
+            nombres.str.replace(_LEADING_NUM_RE, "", regex=True)
+            .str.replace(_PAREN_RE, "", regex=True)
+            .str.strip()
+        )
+        ASTEROIDES_PARA_MENU = nombres.tolist()
+except Exception:
+    ASTEROIDES_PARA_MENU = list(map(limpiar_nombre, EMERGENCY_LIST))
 
 # -----------------------------
 # Función para obtener elementos orbitales desde la API
@@ -42,7 +59,7 @@ ASTEROIDES_PARA_MENU = [limpiar_nombre(n) for n in ASTEROIDES_PARA_MENU]
 def fetch_orbit_elements(asteroide_name):
     url = f"https://ssd-api.jpl.nasa.gov/sbdb.api?des={quote(asteroide_name)}"
     try:
-        r = requests.get(url, timeout=10)
+        r = HTTP_CLIENT.get(url)
         if r.status_code != 200:
             return None
         data = r.json()
@@ -74,33 +91,30 @@ def fetch_orbit_elements(asteroide_name):
 # -----------------------------
 # Función para crear órbita 3D
 # -----------------------------
+_THETA = np.linspace(0, 2*np.pi, 500)
+_COS_THETA = np.cos(_THETA)
+_SIN_THETA = np.sin(_THETA)
+
 def create_orbit(a, e, i, omega, w, color, name):
-    theta = np.linspace(0, 2*np.pi, 500)
     b = a * np.sqrt(1 - e**2)
-    x = a * np.cos(theta) - e
-    y = b * np.sin(theta)
-    z = np.zeros_like(theta)
-
-    def rotation_matrix(omega, i, w):
-        Rz_omega = np.array([
-            [np.cos(omega), -np.sin(omega), 0],
-            [np.sin(omega),  np.cos(omega), 0],
-            [0, 0, 1]
-        ])
-        Rx_i = np.array([
-            [1, 0, 0],
-            [0, np.cos(i), -np.sin(i)],
-            [0, np.sin(i),  np.cos(i)]
-        ])
-        Rz_w = np.array([
-            [np.cos(w), -np.sin(w), 0],
-            [np.sin(w),  np.cos(w), 0],
-            [0, 0, 1]
-        ])
-        return Rz_omega @ Rx_i @ Rz_w
-
-    R = rotation_matrix(omega, i, w)
-    coords = R @ np.vstack((x, y, z))
+    x = a * _COS_THETA - e
+    y = b * _SIN_THETA
+
+    # Rz(omega) @ Rx(i) @ Rz(w) desarrollada; z = 0 en el plano orbital, así que basta con dos columnas.
+    c_om, s_om = np.cos(omega), np.sin(omega)
+    c_i, s_i = np.cos(i), np.sin(i)
+    c_w, s_w = np.cos(w), np.sin(w)
+    r00 = c_om * c_w - s_om * c_i * s_w
+    r01 = -c_om * s_w - s_om * c_i * c_w
+    r10 = s_om * c_w + c_om * c_i * s_w
+    r11 = -s_om * s_w + c_om * c_i * c_w
+    r20 = s_i * s_w
+    r21 = s_i * c_w
+
+    coords = np.empty((3, _THETA.size))
+    coords[0] = r00 * x + r01 * y
+    coords[1] = r10 * x + r11 * y
+    coords[2] = r20 * x + r21 * y
 
     return go.Scatter3d(
         x=coords[0], y=coords[1], z=coords[2],
@@ -210,12 +224,15 @@ def create_base_figure():
         ),
         paper_bgcolor='black',
         plot_bgcolor='black',
-        title=dict(text="Órbita 3D del Sistema Solar Interior", font=dict(color='white')),
+        title=dict(text=BASE_TITLE, font=dict(color='white')),
         legend=dict(font=dict(color='white'))
     )
 
     return fig
 
+# La figura base no cambia: se construye una sola vez al importar el módulo.
+_BASE_FIG = create_base_figure()
+
 # -----------------------------
 # Crear app Dash
 # -----------------------------
@@ -233,28 +250,31 @@ app.layout = html.Div(
             placeholder="Elige un asteroide...",
             style={"width": "50%", "margin": "auto", "color": "black"}
         ),
-        html.Div(id="status-text", style={"marginTop": "15px"}),
-        dcc.Graph(id="orbit-graph", figure=create_base_figure(), style={"height": "90vh"})
+        html.Div(MENSAJE_INICIAL, id="status-text", style={"marginTop": "15px"}),
+        dcc.Store(id="asteroide-orbita"),
+        dcc.Graph(id="orbit-graph", figure=_BASE_FIG, style={"height": "90vh"})
     ]
 )
 
 # -----------------------------
-# Callback interactivo
+# Callbacks interactivos
 # -----------------------------
+# El servidor solo calcula la traza del asteroide; assets/orbit.js la inserta en la figura
+# del navegador, así la escena base no vuelve a viajar en cada selección.
 @app.callback(
-    [Output("orbit-graph", "figure"), Output("status-text", "children")],
-    [Input("asteroide-dropdown", "value")]
+    [Output("asteroide-orbita", "data"), Output("status-text", "children")],
+    [Input("asteroide-dropdown", "value")],
+    prevent_initial_call=True
 )
 def actualizar_orbita(asteroide_name):
-    fig = create_base_figure()
+    sin_orbita = {"trace": None, "title": BASE_TITLE}
 
     if not asteroide_name:
-        return fig, "🌍 Selecciona un asteroide para mostrar su órbita."
+        return sin_orbita, MENSAJE_INICIAL
 
-    status = f"⏳ Descargando elementos orbitales de {asteroide_name}..."
     elems = fetch_orbit_elements(asteroide_name)
     if not elems:
-        return fig, f"No se pudieron obtener datos para {asteroide_name}."
+        return sin_orbita, f"No se pudieron obtener datos para {asteroide_name}."
 
     try:
         a = float(elems.get("a") or elems.get("A"))
@@ -263,20 +283,31 @@ def actualizar_orbita(asteroide_name):
         om_deg = float(elems.get("om") or elems.get("node") or elems.get("OM") or elems.get("Om"))
         w_deg = float(elems.get("w") or elems.get("argp") or elems.get("pericenter") or elems.get("W"))
     except Exception:
-        return fig, f"Datos incompletos para {asteroide_name}."
+        return sin_orbita, f"Datos incompletos para {asteroide_name}."
 
-    fig.add_trace(create_orbit(
+    trace = create_orbit(
         a=a, e=e,
         i=np.radians(i_deg),
         omega=np.radians(om_deg),
         w=np.radians(w_deg),
         color="cyan", name=asteroide_name
-    ))
+    )
 
-    fig.update_layout(title=f"Órbita 3D de {asteroide_name} junto a la Tierra")
+    orbita = {
+        "trace": trace.to_plotly_json(),
+        "title": f"Órbita 3D de {asteroide_name} junto a la Tierra",
+    }
     status = f" Órbita de {asteroide_name} cargada correctamente."
 
-    return fig, status
+    return orbita, status
+
+app.clientside_callback(
+    ClientsideFunction(namespace="orbit", function_name="addAsteroid"),
+    Output("orbit-graph", "figure"),
+    Input("asteroide-orbita", "data"),
+    State("orbit-graph", "figure"),
+    prevent_initial_call=True
+)
 
 # -----------------------------
 # Ejecutar servidor
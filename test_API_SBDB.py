@@ -1,7 +1,7 @@
-import requests
+import httpx
 import json
 
-def get_potentially_hazardous_asteroids():
+def get_potentially_hazardous_asteroids(client: httpx.Client):
     url = (
         "https://ssd-api.jpl.nasa.gov/sbdb_query.api?"
         "fields=full_name,spkid,a,e,q,i,w,per,per_y,n,H,diameter,GM,density,albedo"
@@ -9,7 +9,7 @@ def get_potentially_hazardous_asteroids():
     )
 
     print("🚀 Consultando JPL SBDB: PHAs...")
-    response = requests.get(url)
+    response = client.get(url)
     if response.status_code != 200:
         raise Exception(f"HTTP Error {response.status_code}: {response.text}")
 
@@ -27,10 +27,10 @@ def get_potentially_hazardous_asteroids():
 
     return phas
 
-def get_detailed_asteroid_data(spkid):
+def get_detailed_asteroid_data(spkid, client: httpx.Client):
     url = f"https://ssd-api.jpl.nasa.gov/sbdb.api?spk={spkid}&phys-par=1&vi-data=1&discovery=1"
     print(f"🔍 Consultando datos detallados del asteroide SPKID={spkid}...")
-    response = requests.get(url)
+    response = client.get(url)
     if response.status_code != 200:
         raise Exception(f"HTTP Error {response.status_code}: {response.text}")
 
@@ -42,8 +42,10 @@ def get_detailed_asteroid_data(spkid):
     return data
 
 if __name__ == "__main__":
-    phas = get_potentially_hazardous_asteroids()
+    # Una sola conexión (HTTP/2, keep-alive) para ambas consultas
+    with httpx.Client(http2=True, timeout=30) as client:
+        phas = get_potentially_hazardous_asteroids(client)
 
-    # Ejemplo: elegimos el primero de la lista
-    elegido = phas[55]["spkid"]
-    detalle = get_detailed_asteroid_data(elegido)
+        # Ejemplo: elegimos el primero de la lista
+        elegido = phas[55]["spkid"]
+        detalle = get_detailed_asteroid_data(elegido, client)
@@ -1,11 +1,17 @@
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def extraer_datos_completos(spkid):
     nombre_archivo = f"PHA_detailed_{spkid}.json"
     
     try:
-        with open(nombre_archivo, "r") as f:
-            data = json.load(f)
+        with open(nombre_archivo, "rb") as f:
+            contenido = f.read()
+        data = orjson.loads(contenido) if orjson else json.loads(contenido)
     except FileNotFoundError:
         print(f"Archivo {nombre_archivo} no encontrado.")
         return